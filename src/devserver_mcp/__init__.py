@@ -1,27 +1,39 @@
-import asyncio
-import contextlib
+import importlib
 import os
-import socket
 import sys
+from functools import cached_property
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
-from devserver_mcp.config import load_config, resolve_config_path
-from devserver_mcp.manager import DevServerManager
-from devserver_mcp.mcp_server import create_mcp_server
-from devserver_mcp.types import Config
-from devserver_mcp.ui import DevServerTUI
-from devserver_mcp.utils import _cleanup_loop, configure_silent_logging, no_op_exception_handler, silence_all_output
+if TYPE_CHECKING:
+    from devserver_mcp.types import Config
 
 __version__ = "0.6.0"
 
+_LAZY_ATTRS = {
+    "Config": "devserver_mcp.types",
+    "DevServerManager": "devserver_mcp.manager",
+    "DevServerTUI": "devserver_mcp.ui",
+    "create_mcp_server": "devserver_mcp.mcp_server",
+    "load_config": "devserver_mcp.config",
+    "resolve_config_path": "devserver_mcp.config",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
+
 
 class DevServerMCP:
     def __init__(
         self,
         config_path: str | None = None,
-        config: Config | None = None,
+        config: "Config | None" = None,
         port: int = 3001,
         _skip_port_check: bool = False,
     ):
@@ -34,22 +46,34 @@ class DevServerMCP:
         if not _skip_port_check:
             self._check_port_availability()
 
-        project_path = str(Path(config_path).parent) if config_path else None
-        self.manager = DevServerManager(self.config, project_path)
-        self.mcp = create_mcp_server(self.manager)
+        self._project_path = str(Path(config_path).parent) if config_path else None
         self._mcp_task = None
 
-    def _load_config(self, config_path: str | None, config: Config | None) -> Config:
+    @cached_property
+    def manager(self):
+        from devserver_mcp.manager import DevServerManager
+
+        return DevServerManager(self.config, self._project_path)
+
+    @cached_property
+    def mcp(self):
+        from devserver_mcp.mcp_server import create_mcp_server
+
+        return create_mcp_server(self.manager)
+
+    def _load_config(self, config_path: str | None, config: "Config | None") -> "Config":
         if config is not None:
             return config
         if config_path is not None:
+            from devserver_mcp.config import load_config
+
             return load_config(config_path)
         raise ValueError("Either config_path or config must be provided")
 
     def _is_interactive_terminal(self) -> bool:
         if os.environ.get("CI"):
             return False
-        return sys.stdout.isatty() and sys.stderr.isatty()
+        return os.isatty(1) and os.isatty(2)
 
     def _check_playwright_availability(self):
         try:
@@ -68,8 +92,12 @@ class DevServerMCP:
             sys.exit(1)
 
     def _check_port_availability(self):
+        import socket
+
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+                if sys.platform == "linux":
+                    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
                 s.bind(("localhost", self.port))
         except OSError:
             click.echo(f"Error: Port {self.port} is already in use.", err=True)
@@ -79,16 +107,23 @@ class DevServerMCP:
             sys.exit(1)
 
     async def run(self):
+        from devserver_mcp.utils import configure_silent_logging
+
         configure_silent_logging()
         await self._run_with_tui()
 
     async def _run_with_tui(self):
+        import asyncio
+
+        from devserver_mcp.ui import DevServerTUI
+
         self._mcp_task = asyncio.create_task(
             self.mcp.run_async(
                 transport="streamable-http",
                 port=self.port,
                 host="localhost",
-            )
+            ),
+            name="devserver-mcp",
         )
 
         mcp_url = f"http://localhost:{self.port}/mcp/"
@@ -104,14 +139,16 @@ class DevServerMCP:
             await self._cleanup()
 
     async def _cleanup(self):
+        import asyncio
+
+        from devserver_mcp.utils import silence_all_output
+
         with silence_all_output():
-            if self._mcp_task and not self._mcp_task.done():
+            shutdown = [self.manager.shutdown_all()]
+            if self._mcp_task is not None:
                 self._mcp_task.cancel()
-                with contextlib.suppress(TimeoutError, asyncio.CancelledError):
-                    await asyncio.wait_for(self._mcp_task, timeout=0.5)
-
-            await self.manager.shutdown_all()
-            await asyncio.sleep(0.1)
+                shutdown.append(asyncio.wait_for(self._mcp_task, timeout=0.5))
+            await asyncio.gather(*shutdown, return_exceptions=True)
 
 
 @click.command()
@@ -120,7 +157,11 @@ class DevServerMCP:
 )
 @click.option("--port", "-p", default=3001, type=int, help="Port for server")
 def main(config, port):
-    configure_silent_logging()
+    import asyncio
+
+    from devserver_mcp.config import resolve_config_path
+    from devserver_mcp.utils import _cleanup_loop, new_event_loop, no_op_exception_handler
+
     config = resolve_config_path(config)
 
     try:
@@ -133,7 +174,8 @@ def main(config, port):
         click.echo(f"Error loading config: {e}", err=True)
         sys.exit(1)
 
-    loop = asyncio.new_event_loop()
+    loop = new_event_loop()
+    loop.set_task_factory(asyncio.eager_task_factory)
     loop.set_exception_handler(no_op_exception_handler)
     asyncio.set_event_loop(loop)
 
@@ -1,9 +1,11 @@
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import yaml
+if TYPE_CHECKING:
+    from devserver_mcp.types import Config
 
-from devserver_mcp.types import Config
+_config_cache: dict[tuple[str, int, int], "Config"] = {}
 
 
 def resolve_config_path(config_path: str) -> str:
@@ -22,24 +24,23 @@ def resolve_config_path(config_path: str) -> str:
             except (OSError, PermissionError):
                 return config_path
 
-        current = cwd
+        current = str(cwd)
         max_depth = 20
         depth = 0
 
-        while current != current.parent and depth < max_depth:
+        while current != os.path.dirname(current) and depth < max_depth:
             try:
-                test_path = current / config_path
-                if test_path.exists():
-                    return str(test_path)
+                test_path = os.path.join(current, config_path)
+                if os.path.exists(test_path):
+                    return test_path
 
-                git_dir = current / ".git"
-                if git_dir.exists():
+                if os.path.exists(os.path.join(current, ".git")):
                     break
 
             except (OSError, PermissionError):
                 pass
 
-            current = current.parent
+            current = os.path.dirname(current)
             depth += 1
 
     except Exception:
@@ -48,12 +49,23 @@ def resolve_config_path(config_path: str) -> str:
     return config_path
 
 
-def load_config(config_path: str) -> Config:
-    path = Path(config_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Config file not found: {config_path}")
-
-    with open(path) as f:
-        data = yaml.safe_load(f)
-
-    return Config(**data)
+def load_config(config_path: str) -> "Config":
+    try:
+        with open(config_path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            cache_key = (os.path.abspath(config_path), stat.st_mtime_ns, stat.st_size)
+            cached = _config_cache.get(cache_key)
+            if cached is not None:
+                return cached.model_copy(deep=True)
+            raw_config = f.read()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
+
+    import yaml
+
+    from devserver_mcp.types import Config
+
+    data = yaml.load(raw_config, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    config = Config(**data)
+    _config_cache[cache_key] = config
+    return config.model_copy(deep=True)
@@ -1,4 +1,5 @@
 from collections import deque
+from itertools import islice
 from threading import Lock
 
 
@@ -12,6 +13,10 @@ class LogStorage:
         with self._lock:
             self._logs.append(line)
 
+    def extend(self, lines: list[str]) -> None:
+        with self._lock:
+            self._logs.extend(lines)
+
     def get_range(self, offset: int = 0, limit: int = 100, reverse: bool = True) -> tuple[list[str], int, bool]:
         with self._lock:
             total = len(self._logs)
@@ -30,13 +35,12 @@ class LogStorage:
                 if end <= 0:
                     # Offset is beyond total, no logs to return
                     return [], total, False
-                logs = list(self._logs)[start:end]
-                logs.reverse()
+                logs = list(islice(reversed(self._logs), offset, max(offset, end - start + offset)))
                 has_more = start > 0
             else:
                 start = offset
                 end = min(offset + limit, total)
-                logs = list(self._logs)[start:end]
+                logs = list(islice(self._logs, start, max(start, end)))
                 has_more = end < total
 
             return logs, total, has_more
@@ -1,7 +1,8 @@
 import asyncio
 import contextlib
 import socket
-from datetime import datetime
+import sys
+import time
 from pathlib import Path
 from typing import Any, Literal
 
@@ -9,6 +10,7 @@ from devserver_mcp.process import ManagedProcess
 from devserver_mcp.state import StateManager
 from devserver_mcp.types import (
     Config,
+    LogBatchCallback,
     LogCallback,
     LogsResult,
     OperationStatus,
@@ -16,7 +18,21 @@ from devserver_mcp.types import (
     ServerStatus,
     ServerStatusEnum,
 )
-from devserver_mcp.utils import get_tool_emoji, log_error_to_file
+from devserver_mcp.utils import get_log_timestamp, get_tool_emoji, log_error_to_file
+
+PORT_STATUS_TTL = 0.5
+PORT_RELEASE_TIMEOUT = 0.5
+PORT_RELEASE_POLL_INTERVAL = 0.01
+SERVER_NOT_FOUND = "Server '{}' not found"
+
+
+def _server_not_found(name: str) -> ServerOperationResult:
+    return ServerOperationResult(status=OperationStatus.ERROR, message=SERVER_NOT_FOUND.format(name))
+
+
+def _logs_not_found(name: str) -> LogsResult:
+    return LogsResult(status="error", message=SERVER_NOT_FOUND.format(name))
+
 
 SERVER_COLORS = ["cyan", "magenta", "yellow", "green", "blue", "red", "bright_cyan", "bright_magenta", "bright_yellow"]
 
@@ -26,7 +42,9 @@ class DevServerManager:
         self.config = config
         self.processes: dict[str, ManagedProcess] = {}
         self._log_callbacks: list[LogCallback] = []
+        self._log_batch_callbacks: list[LogBatchCallback] = []
         self._status_callbacks: list = []
+        self._port_cache: dict[int, tuple[float, bool]] = {}
         self._playwright_operator = None
         self._playwright_config_enabled = config.experimental and config.experimental.playwright
         self._playwright_init_error = None
@@ -39,11 +57,14 @@ class DevServerManager:
         self._init_playwright_if_enabled()
 
     async def autostart_configured_servers(self):
+        pending_starts = []
         for name, process in self.processes.items():
             if process.config.autostart:
                 server_status = self.get_server_status(name)
                 if server_status["status"] == "stopped":  # Server is not running and port is not in use
-                    await self.start_server(name)
+                    pending_starts.append(self.start_server(name))
+
+        await asyncio.gather(*pending_starts)
 
         # Auto-start Playwright if enabled
         await self._autostart_playwright()
@@ -54,28 +75,56 @@ class DevServerManager:
             config = self.config.servers[name]
             self.processes[name.lower()] = ManagedProcess(name, config, color, self.state_manager)
 
+    def _get_process(self, name: str) -> ManagedProcess | None:
+        return self.processes.get(name) or self.processes.get(name.lower())
+
     def add_log_callback(self, callback: LogCallback):
         self._log_callbacks.append(callback)
 
+    def add_log_batch_callback(self, callback: LogBatchCallback):
+        self._log_batch_callbacks.append(callback)
+
+    @property
+    def has_log_callbacks(self) -> bool:
+        return bool(self._log_callbacks or self._log_batch_callbacks)
+
     def add_status_callback(self, callback):
         self._status_callbacks.append(callback)
 
     async def _notify_log(self, server: str, timestamp: str, message: str):
-        for callback in self._log_callbacks:
-            with contextlib.suppress(Exception):
-                result = callback(server, timestamp, message)
+        await self._notify_log_batch(server, timestamp, [message])
+
+    async def _notify_log_batch(self, server: str, timestamp: str, messages: list[str]):
+        batch_results = []
+        for batch_callback in tuple(self._log_batch_callbacks):
+            try:
+                result = batch_callback(server, timestamp, messages)
                 if asyncio.iscoroutine(result):
-                    await result
+                    batch_results.append(result)
+            except Exception:
+                pass
+
+        for callback in tuple(self._log_callbacks):
+            for message in messages:
+                try:
+                    result = callback(server, timestamp, message)
+                    if asyncio.iscoroutine(result):
+                        await result
+                except Exception:
+                    pass
+
+        if batch_results:
+            await asyncio.gather(*batch_results, return_exceptions=True)
 
     def _notify_status_change(self):
-        for callback in self._status_callbacks:
+        for callback in tuple(self._status_callbacks):
             with contextlib.suppress(Exception):
                 callback()
 
     async def start_server(self, name: str) -> ServerOperationResult:
-        process = self.processes.get(name.lower())
+        process = self._get_process(name)
         if not process:
-            return ServerOperationResult(status=OperationStatus.ERROR, message=f"Server '{name}' not found")
+            return _server_not_found(name)
 
         if process.is_running:
             return ServerOperationResult(
@@ -85,7 +134,8 @@ class DevServerManager:
         if self._is_port_in_use(process.config.port):
             return ServerOperationResult(status=OperationStatus.ERROR, message=f"Port {process.config.port} in use")
 
-        success = await process.start(self._notify_log)
+        success = await process.start(self._notify_log_batch)
+        self._port_cache.pop(process.config.port, None)
         self._notify_status_change()
 
         if success:
@@ -96,12 +146,13 @@ class DevServerManager:
             )
 
     async def stop_server(self, name: str) -> ServerOperationResult:
-        process = self.processes.get(name.lower())
+        process = self._get_process(name)
         if not process:
-            return ServerOperationResult(status=OperationStatus.ERROR, message=f"Server '{name}' not found")
+            return _server_not_found(name)
 
         if process.is_running:
             await process.stop()
+            await self._wait_for_port_release(process.config.port)
             self._notify_status_change()
             return ServerOperationResult(status=OperationStatus.STOPPED, message=f"Server '{name}' stopped")
 
@@ -114,9 +165,9 @@ class DevServerManager:
         return ServerOperationResult(status=OperationStatus.NOT_RUNNING, message=f"Server '{name}' not running")
 
     def get_server_status(self, name: str) -> dict:
-        process = self.processes.get(name.lower())
+        process = self._get_process(name)
         if not process:
-            return {"status": "error", "message": f"Server '{name}' not found"}
+            return {"status": "error", "message": SERVER_NOT_FOUND.format(name)}
 
         if process.is_running:
             return {
@@ -135,9 +186,9 @@ class DevServerManager:
             return {"status": "stopped", "port": process.config.port, "error": process.error}
 
     def get_devserver_logs(self, name: str, offset: int = 0, limit: int = 100, reverse: bool = True) -> LogsResult:
-        process = self.processes.get(name.lower())
+        process = self._get_process(name)
         if not process:
-            return LogsResult(status="error", message=f"Server '{name}' not found")
+            return _logs_not_found(name)
 
         if not process.is_running:
             if self._is_port_in_use(process.config.port):
@@ -157,10 +208,11 @@ class DevServerManager:
 
     def get_devserver_statuses(self) -> list[ServerStatus]:
         servers = []
-        for _name, process in self.processes.items():
+        for process in self.processes.values():
+            port = process.config.port
             if process.is_running:
                 status = ServerStatusEnum.RUNNING
-            elif self._is_port_in_use(process.config.port):
+            elif self._is_port_in_use(port):
                 status = ServerStatusEnum.EXTERNAL
             else:
                 status = ServerStatusEnum.STOPPED
@@ -169,7 +221,7 @@ class DevServerManager:
                 ServerStatus(
                     name=process.name,
                     status=status,
-                    port=process.config.port,
+                    port=port,
                     error=process.error,
                     color=process.color,
                 )
@@ -185,17 +237,36 @@ class DevServerManager:
         if stop_tasks:
             await asyncio.gather(*stop_tasks, return_exceptions=True)
 
+        self._port_cache.clear()
         await self._shutdown_playwright()
 
         self._notify_status_change()
 
     def _is_port_in_use(self, port: int) -> bool:
+        now = time.monotonic()
+        cached = self._port_cache.get(port)
+        if cached is not None and now - cached[0] < PORT_STATUS_TTL:
+            return cached[1]
+
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            if sys.platform == "linux":
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             try:
-                s.bind(("localhost", port))
-                return False
+                s.bind(("127.0.0.1", port))
+                in_use = False
             except OSError:
-                return True
+                in_use = True
+
+        self._port_cache[port] = (now, in_use)
+        return in_use
+
+    async def _wait_for_port_release(self, port: int) -> None:
+        deadline = time.monotonic() + PORT_RELEASE_TIMEOUT
+        while True:
+            self._port_cache.pop(port, None)
+            if not self._is_port_in_use(port) or time.monotonic() >= deadline:
+                return
+            await asyncio.sleep(PORT_RELEASE_POLL_INTERVAL)
 
     def _init_playwright_if_enabled(self):
         if self._playwright_config_enabled:
@@ -213,7 +284,7 @@ class DevServerManager:
             if self._playwright_init_error:
                 await self._notify_log(
                     f"{get_tool_emoji()} Playwright",
-                    datetime.now().strftime("%H:%M:%S"),
+                    get_log_timestamp(),
                     f"Failed to initialize: {self._playwright_init_error}",
                 )
                 self._notify_status_change()
@@ -222,7 +293,7 @@ class DevServerManager:
                     await self._playwright_operator.initialize()
                     await self._notify_log(
                         f"{get_tool_emoji()} Playwright",
-                        datetime.now().strftime("%H:%M:%S"),
+                        get_log_timestamp(),
                         "Browser started successfully",
                     )
                     self._notify_status_change()
@@ -230,7 +301,7 @@ class DevServerManager:
                     log_error_to_file(e, "Playwright autostart")
                     await self._notify_log(
                         f"{get_tool_emoji()} Playwright",
-                        datetime.now().strftime("%H:%M:%S"),
+                        get_log_timestamp(),
                         f"Failed to start browser: {e}",
                     )
                     self._notify_status_change()
@@ -260,9 +331,7 @@ class DevServerManager:
 
         try:
             result = await self._playwright_operator.navigate(url, wait_until)
-            await self._notify_log(
-                f"{get_tool_emoji()} Playwright", datetime.now().strftime("%H:%M:%S"), f"Navigated to {url}"
-            )
+            await self._notify_log(f"{get_tool_emoji()} Playwright", get_log_timestamp(), f"Navigated to {url}")
             return result
         except Exception as e:
             log_error_to_file(e, "playwright_navigate")
@@ -277,7 +346,7 @@ class DevServerManager:
             page_url = result.get("url", "unknown page")
             await self._notify_log(
                 f"{get_tool_emoji()} Playwright",
-                datetime.now().strftime("%H:%M:%S"),
+                get_log_timestamp(),
                 f"Captured accessibility snapshot of {page_url}",
             )
             return result
@@ -299,7 +368,7 @@ class DevServerManager:
             clear_text = " and cleared" if clear else ""
             await self._notify_log(
                 f"{get_tool_emoji()} Playwright",
-                datetime.now().strftime("%H:%M:%S"),
+                get_log_timestamp(),
                 f"Retrieved {message_count} of {total} console messages{clear_text}",
             )
             return {
@@ -322,7 +391,7 @@ class DevServerManager:
             result = await self._playwright_operator.click(ref)
             await self._notify_log(
                 f"{get_tool_emoji()} Playwright",
-                datetime.now().strftime("%H:%M:%S"),
+                get_log_timestamp(),
                 f"Clicked element: {ref}",
             )
             return result
@@ -340,7 +409,7 @@ class DevServerManager:
             slowly_text = " slowly" if slowly else ""
             await self._notify_log(
                 f"{get_tool_emoji()} Playwright",
-                datetime.now().strftime("%H:%M:%S"),
+                get_log_timestamp(),
                 f"Typed {len(text)} characters{slowly_text} into element: {ref}{submit_text}",
             )
             return result
@@ -356,7 +425,7 @@ class DevServerManager:
             result = await self._playwright_operator.resize(width, height)
             await self._notify_log(
                 f"{get_tool_emoji()} Playwright",
-                datetime.now().strftime("%H:%M:%S"),
+                get_log_timestamp(),
                 f"Resized viewport to {width}x{height}",
             )
             return result
@@ -375,7 +444,7 @@ class DevServerManager:
             name_text = f" as '{name}'" if name else ""
             await self._notify_log(
                 f"{get_tool_emoji()} Playwright",
-                datetime.now().strftime("%H:%M:%S"),
+                get_log_timestamp(),
                 f"Screenshot saved to {filepath}{full_page_text}{name_text}",
             )
             return result
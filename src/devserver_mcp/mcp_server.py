@@ -1,4 +1,3 @@
-from datetime import datetime
 from typing import Any, Literal
 
 from fastmcp import FastMCP
@@ -9,47 +8,45 @@ from devserver_mcp.types import (
     ServerOperationResult,
     ServerStatus,
 )
-from devserver_mcp.utils import get_tool_emoji, log_error_to_file
+from devserver_mcp.utils import get_log_timestamp, get_tool_emoji, log_error_to_file
+
+
+async def _log_tool_call(
+    manager: DevServerManager, source: str, tool_name: str, params: dict[str, Any] | None = None
+) -> None:
+    if not manager.has_log_callbacks:
+        return
+    message = f"Tool '{tool_name}' called with: {params!r}" if params else f"Tool '{tool_name}' called"
+    await manager._notify_log(source, get_log_timestamp(), message)
 
 
 def create_mcp_server(manager: DevServerManager) -> FastMCP:
     mcp = FastMCP("devserver")
+    source = "MCP Server"
 
     @mcp.tool
     async def start_server(name: str) -> ServerOperationResult:
-        await manager._notify_log(
-            "MCP Server",
-            datetime.now().strftime("%H:%M:%S"),
-            f"Tool 'start_server' called with: {{'name': {repr(name)}}}",
-        )
+        await _log_tool_call(manager, source, "start_server", {"name": name})
         return await manager.start_server(name)
 
     @mcp.tool
     async def stop_server(name: str) -> ServerOperationResult:
-        await manager._notify_log(
-            "MCP Server",
-            datetime.now().strftime("%H:%M:%S"),
-            f"Tool 'stop_server' called with: {{'name': {repr(name)}}}",
-        )
+        await _log_tool_call(manager, source, "stop_server", {"name": name})
         return await manager.stop_server(name)
 
     @mcp.tool
     async def get_devserver_logs(name: str, offset: int = 0, limit: int = 100, reverse: bool = True) -> LogsResult:
-        await manager._notify_log(
-            "MCP Server",
-            datetime.now().strftime("%H:%M:%S"),
-            f"Tool 'get_devserver_logs' called with: "
-            f"{{'name': {repr(name)}, 'offset': {offset}, 'limit': {limit}, 'reverse': {reverse}}}",
+        await _log_tool_call(
+            manager,
+            source,
+            "get_devserver_logs",
+            {"name": name, "offset": offset, "limit": limit, "reverse": reverse},
         )
         return manager.get_devserver_logs(name, offset, limit, reverse)
 
     @mcp.tool
     async def get_devserver_statuses() -> list[ServerStatus]:
-        await manager._notify_log(
-            "MCP Server",
-            datetime.now().strftime("%H:%M:%S"),
-            "Tool 'get_devserver_statuses' called",
-        )
+        await _log_tool_call(manager, source, "get_devserver_statuses")
         return manager.get_devserver_statuses()
 
     if manager.config.experimental and manager.config.experimental.playwright:
@@ -59,15 +56,13 @@ def create_mcp_server(manager: DevServerManager) -> FastMCP:
 
 
 def _add_playwright_commands(mcp: FastMCP, manager: DevServerManager) -> None:
+    source = f"{get_tool_emoji()} Playwright"
+
     @mcp.tool
     async def browser_navigate(
         url: str, wait_until: Literal["commit", "domcontentloaded", "load", "networkidle"] = "networkidle"
     ) -> dict[str, Any]:
-        await manager._notify_log(
-            f"{get_tool_emoji()} Playwright",
-            datetime.now().strftime("%H:%M:%S"),
-            f"Tool 'browser_navigate' called with: {{'url': {repr(url)}, 'wait_until': {repr(wait_until)}}}",
-        )
+        await _log_tool_call(manager, source, "browser_navigate", {"url": url, "wait_until": wait_until})
         try:
             return await manager.playwright_navigate(url, wait_until)
         except Exception as e:
@@ -76,11 +71,7 @@ def _add_playwright_commands(mcp: FastMCP, manager: DevServerManager) -> None:
 
     @mcp.tool
     async def browser_snapshot() -> dict[str, Any]:
-        await manager._notify_log(
-            f"{get_tool_emoji()} Playwright",
-            datetime.now().strftime("%H:%M:%S"),
-            "Tool 'browser_snapshot' called",
-        )
+        await _log_tool_call(manager, source, "browser_snapshot")
         try:
             return await manager.playwright_snapshot()
         except Exception as e:
@@ -91,11 +82,11 @@ def _add_playwright_commands(mcp: FastMCP, manager: DevServerManager) -> None:
     async def browser_console_messages(
         clear: bool = False, offset: int = 0, limit: int = 100, reverse: bool = True
     ) -> dict[str, Any]:
-        await manager._notify_log(
-            f"{get_tool_emoji()} Playwright",
-            datetime.now().strftime("%H:%M:%S"),
-            f"Tool 'browser_console_messages' called with: "
-            f"{{'clear': {clear}, 'offset': {offset}, 'limit': {limit}, 'reverse': {reverse}}}",
+        await _log_tool_call(
+            manager,
+            source,
+            "browser_console_messages",
+            {"clear": clear, "offset": offset, "limit": limit, "reverse": reverse},
         )
         try:
             return await manager.playwright_console_messages(clear, offset, limit, reverse)
@@ -105,11 +96,7 @@ def _add_playwright_commands(mcp: FastMCP, manager: DevServerManager) -> None:
 
     @mcp.tool
     async def browser_click(ref: str) -> dict[str, Any]:
-        await manager._notify_log(
-            f"{get_tool_emoji()} Playwright",
-            datetime.now().strftime("%H:%M:%S"),
-            f"Tool 'browser_click' called with: {{'ref': {repr(ref)}}}",
-        )
+        await _log_tool_call(manager, source, "browser_click", {"ref": ref})
         try:
             return await manager.playwright_click(ref)
         except Exception as e:
@@ -119,11 +106,11 @@ def _add_playwright_commands(mcp: FastMCP, manager: DevServerManager) -> None:
     @mcp.tool
     async def browser_type(ref: str, text: str, submit: bool = False, slowly: bool = False) -> dict[str, Any]:
         text_preview = text[:20] + "..." if len(text) > 20 else text
-        params = f"{{'ref': {repr(ref)}, 'text': {repr(text_preview)}, 'submit': {submit}, 'slowly': {slowly}}}"
-        await manager._notify_log(
-            f"{get_tool_emoji()} Playwright",
-            datetime.now().strftime("%H:%M:%S"),
-            f"Tool 'browser_type' called with: {params}",
+        await _log_tool_call(
+            manager,
+            source,
+            "browser_type",
+            {"ref": ref, "text": text_preview, "submit": submit, "slowly": slowly},
         )
         try:
             return await manager.playwright_type(ref, text, submit, slowly)
@@ -133,11 +120,7 @@ def _add_playwright_commands(mcp: FastMCP, manager: DevServerManager) -> None:
 
     @mcp.tool
     async def browser_resize(width: int, height: int) -> dict[str, Any]:
-        await manager._notify_log(
-            f"{get_tool_emoji()} Playwright",
-            datetime.now().strftime("%H:%M:%S"),
-            f"Tool 'browser_resize' called with: {{'width': {width}, 'height': {height}}}",
-        )
+        await _log_tool_call(manager, source, "browser_resize", {"width": width, "height": height})
         try:
             return await manager.playwright_resize(width, height)
         except Exception as e:
@@ -146,11 +129,7 @@ def _add_playwright_commands(mcp: FastMCP, manager: DevServerManager) -> None:
 
     @mcp.tool
     async def browser_screenshot(full_page: bool = False, name: str | None = None) -> dict[str, Any]:
-        await manager._notify_log(
-            f"{get_tool_emoji()} Playwright",
-            datetime.now().strftime("%H:%M:%S"),
-            f"Tool 'browser_screenshot' called with: {{'full_page': {full_page}, 'name': {repr(name)}}}",
-        )
+        await _log_tool_call(manager, source, "browser_screenshot", {"full_page": full_page, "name": name})
         try:
             return await manager.playwright_screenshot(full_page, name)
         except Exception as e:
@@ -1,17 +1,24 @@
 import asyncio
+import contextlib
 import logging
 import os
 import signal
 import sys
 import time
-from datetime import datetime
+from functools import cached_property
 
 from devserver_mcp.log_storage import LogStorage
 from devserver_mcp.state import StateManager
-from devserver_mcp.types import LogCallback, ServerConfig
+from devserver_mcp.types import LogBatchCallback, ServerConfig
+from devserver_mcp.utils import get_log_timestamp
 
 logger = logging.getLogger(__name__)
 
+OUTPUT_BUFFER_LIMIT = 1 << 20
+OUTPUT_READ_SIZE = 1 << 16
+STARTUP_GRACE_PERIOD = 0.5
+OUTPUT_DRAIN_TIMEOUT = 0.5
+
 
 class ManagedProcess:
     """Represents a process managed by the dev server"""
@@ -26,9 +33,14 @@ class ManagedProcess:
         self.logs: LogStorage = LogStorage(max_lines=10000)
         self.start_time: float | None = None
         self.error: str | None = None
+        self._reader_task: asyncio.Task | None = None
 
         self._reclaim_existing_process()
 
+    @cached_property
+    def work_dir(self) -> str:
+        return os.path.abspath(os.path.expanduser(self.config.working_dir))
+
     def _reclaim_existing_process(self) -> None:
         stored_pid = self.state_manager.get_pid(self.name)
         if stored_pid and self._is_process_alive(stored_pid):
@@ -49,7 +61,7 @@ class ManagedProcess:
         except PermissionError:
             return True
 
-    async def start(self, log_callback: LogCallback) -> bool:
+    async def start(self, log_callback: LogBatchCallback) -> bool:
         # If we already have a running process (from reclaim), don't start a new one
         if self.is_running:
             logger.debug(f"Process {self.name} is already running with PID {self.pid}")
@@ -59,9 +71,6 @@ class ManagedProcess:
             self.error = None
             self.start_time = time.time()
 
-            work_dir = os.path.expanduser(self.config.working_dir)
-            work_dir = os.path.abspath(work_dir)
-
             # Set up environment to preserve ANSI colors
             env = os.environ.copy()
             env["TERM"] = "xterm-256color"
@@ -73,9 +82,10 @@ class ManagedProcess:
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.STDOUT,
                 stdin=asyncio.subprocess.DEVNULL,  # Prevent child from reading terminal input
-                cwd=work_dir,
+                cwd=self.work_dir,
                 env=env,
                 start_new_session=sys.platform != "win32",
+                limit=OUTPUT_BUFFER_LIMIT,
             )
 
             if self.process.pid:
@@ -83,8 +93,9 @@ class ManagedProcess:
                 self.state_manager.save_pid(self.name, self.pid)
                 logger.debug(f"Started process {self.name} with PID {self.pid}")
 
-            asyncio.create_task(self._read_output(log_callback))
-            await asyncio.sleep(0.5)
+            self._reader_task = asyncio.create_task(self._read_output(log_callback))
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self.process.wait(), timeout=STARTUP_GRACE_PERIOD)
 
             if self.process.returncode is not None:
                 self.error = f"Process exited immediately with code {self.process.returncode}"
@@ -98,32 +109,48 @@ class ManagedProcess:
             self.error = str(e)
             return False
 
-    async def _read_output(self, log_callback: LogCallback):
+    async def _read_output(self, log_callback: LogBatchCallback):
+        pending = b""
         while self.process and self.process.stdout:
             try:
-                line = await self.process.stdout.readline()
-                if not line:
+                chunk = await self.process.stdout.read(OUTPUT_READ_SIZE)
+                if not chunk:
+                    if pending:
+                        await self._handle_output_lines(pending, log_callback)
                     break
 
-                decoded = line.decode("utf-8", errors="replace").rstrip()
-                if decoded:
-                    if self.config.prefix_logs:
-                        server_name_to_log = self.name
-                        timestamp_to_log = datetime.now().strftime("%H:%M:%S")
-                    else:
-                        server_name_to_log = ""
-                        timestamp_to_log = ""
-
-                    self.logs.append(decoded)  # We still store the raw log
-                    # Handle both sync and async callbacks
-                    # The callback will decide how to use server_name_to_log and timestamp_to_log
-                    result = log_callback(server_name_to_log, timestamp_to_log, decoded)
-                    if asyncio.iscoroutine(result):
-                        await result
+                data = pending + chunk
+                end = data.rfind(b"\n")
+                if end == -1:
+                    pending = data
+                    continue
+
+                pending = data[end + 1 :]
+                await self._handle_output_lines(data[:end], log_callback)
 
             except Exception:
                 break
 
+    async def _handle_output_lines(self, data: bytes, log_callback: LogBatchCallback):
+        text = data.decode("utf-8", errors="replace")
+        decoded_lines = [stripped for line in text.split("\n") if (stripped := line.rstrip())]
+        if not decoded_lines:
+            return
+
+        if self.config.prefix_logs:
+            server_name_to_log = self.name
+            timestamp_to_log = get_log_timestamp()
+        else:
+            server_name_to_log = ""
+            timestamp_to_log = ""
+
+        self.logs.extend(decoded_lines)  # We still store the raw log
+        # Handle both sync and async callbacks
+        # The callback will decide how to use server_name_to_log and timestamp_to_log
+        result = log_callback(server_name_to_log, timestamp_to_log, decoded_lines)
+        if asyncio.iscoroutine(result):
+            await result
+
     async def stop(self):
         if self.pid is not None:
             logger.debug(f"Stopping process {self.name} (PID: {self.pid})")
@@ -169,15 +196,28 @@ class ManagedProcess:
             except (ProcessLookupError, OSError) as e:
                 logger.debug(f"Process {self.name} already terminated: {e}")
             finally:
+                await self._stop_reader()
                 self.process = None
                 self.pid = None
                 self.start_time = None
                 self.state_manager.clear_pid(self.name)
                 logger.debug(f"Process {self.name} cleanup completed")
 
+    async def _stop_reader(self):
+        reader_task, self._reader_task = self._reader_task, None
+        if reader_task is None or reader_task.done():
+            return
+
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(reader_task, timeout=OUTPUT_DRAIN_TIMEOUT)
+
     @property
     def is_running(self) -> bool:
-        return self.pid is not None and self._is_process_alive(self.pid)
+        if self.pid is None:
+            return False
+        if self.process is not None and self.process.pid == self.pid:
+            return self.process.returncode is None
+        return self._is_process_alive(self.pid)
 
     @property
     def status(self) -> str:
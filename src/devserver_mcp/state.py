@@ -27,13 +27,16 @@ class StateManager:
             return {}
 
     def _write_state(self, state: dict[str, int]) -> None:
-        with open(self.state_file, "w") as f:
+        tmp_file = self.state_file.with_name(f"{self.state_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "w") as f:
             json.dump(state, f, indent=2)
+        os.replace(tmp_file, self.state_file)
 
     def save_pid(self, service_name: str, pid: int) -> None:
         state = self._read_state()
-        state[service_name] = pid
-        self._write_state(state)
+        if state.get(service_name) != pid:
+            state[service_name] = pid
+            self._write_state(state)
 
     def get_pid(self, service_name: str) -> int | None:
         state = self._read_state()
@@ -41,8 +44,8 @@ class StateManager:
 
     def clear_pid(self, service_name: str) -> None:
         state = self._read_state()
-        state.pop(service_name, None)
-        self._write_state(state)
+        if state.pop(service_name, None) is not None:
+            self._write_state(state)
 
     def cleanup_dead(self) -> None:
         state = self._read_state()
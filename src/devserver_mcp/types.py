@@ -37,6 +37,7 @@ class ServerStatus(BaseModel):
 
 
 LogCallback = Callable[[str, str, str], None] | Callable[[str, str, str], Awaitable[None]]
+LogBatchCallback = Callable[[str, str, list[str]], None] | Callable[[str, str, list[str]], Awaitable[None]]
 
 
 class OperationStatus(str, Enum):
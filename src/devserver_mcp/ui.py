@@ -1,16 +1,17 @@
-import asyncio
-from datetime import datetime
-
 from rich.text import Text
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical
+from textual.css.query import NoMatches
 from textual.events import Click
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import Label, RichLog, Static
 
 from .manager import DevServerManager
 from .types import ServerStatus, ServerStatusEnum
-from .utils import get_tool_emoji
+from .utils import get_log_timestamp, get_tool_emoji
+
+LOG_FLUSH_INTERVAL = 0.05
 
 
 class ServerBox(Static):
@@ -44,8 +45,6 @@ class ServerBox(Static):
             action_taken = True
         elif self.server.status == ServerStatusEnum.RUNNING:
             await self.manager.stop_server(server_name)
-            # Add small delay to allow port to be released
-            await asyncio.sleep(0.1)
             action_taken = True
 
         if action_taken:
@@ -134,9 +133,9 @@ class ServerStatusWidget(Widget):
         server_data_map = {s_data.name: s_data for s_data in updated_servers_data}
 
         for server_box in self.query(ServerBox):
-            current_server_name = server_box.server.name
-            if current_server_name in server_data_map:
-                server_box.server = server_data_map[current_server_name]
+            updated_server = server_data_map.get(server_box.server.name)
+            if updated_server is not None and updated_server != server_box.server:
+                server_box.server = updated_server
                 server_box._refresh_labels()
 
         for tool_box in self.query(ToolBox):
@@ -147,29 +146,28 @@ class ServerStatusWidget(Widget):
                     new_status = "running"
                 else:
                     new_status = "stopped"
-                tool_box.update_status(new_status)
-
-        self.refresh()
+                if new_status != tool_box.status:
+                    tool_box.update_status(new_status)
 
 
 class LogsWidget(Widget):
     def __init__(self, manager: DevServerManager):
         super().__init__()
         self.manager = manager
-        self.manager.add_log_callback(self.add_log_line)
+        self.manager.add_log_batch_callback(self.add_log_lines)
+        self._pending_lines: list[Text] = []
+        self._flush_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         log = RichLog(highlight=False, markup=False, id="server-logs", auto_scroll=True, wrap=True)
         log.can_focus = True
         yield log
 
-    async def add_log_line(self, server: str, timestamp: str, message: str):
-        log = self.query_one(RichLog)
-
+    async def add_log_lines(self, server: str, timestamp: str, messages: list[str]):
         if server and timestamp:
             timestamp_text = Text(f"[{timestamp}]", style="dim")
 
-            process = self.manager.processes.get(server.lower())
+            process = self.manager._get_process(server)
             if server == "MCP Server":
                 server_style = "bright_white"
             elif server == f"{get_tool_emoji()} Playwright":
@@ -177,12 +175,29 @@ class LogsWidget(Widget):
             else:
                 server_style = process.color if process else "white"
 
-            server_text = Text(f" {server} | ", style=server_style)
-            message_text = Text.from_ansi(message)
-            final_text = timestamp_text + server_text + message_text
-            log.write(final_text)
+            prefix_text = timestamp_text + Text(f" {server} | ", style=server_style)
+            lines = [prefix_text + Text.from_ansi(message) for message in messages]
+        else:
+            lines = [Text.from_ansi(message) for message in messages]
+
+        if self._flush_timer is None:
+            self._write_lines(lines)
+            self._flush_timer = self.set_timer(LOG_FLUSH_INTERVAL, self._flush)
         else:
-            log.write(Text.from_ansi(message))
+            self._pending_lines.extend(lines)
+
+    def _flush(self):
+        self._flush_timer = None
+        if self._pending_lines:
+            lines, self._pending_lines = self._pending_lines, []
+            self._write_lines(lines)
+
+    def _write_lines(self, lines: list[Text]):
+        try:
+            log = self.query_one(RichLog)
+        except NoMatches:
+            return
+        log.write(Text("\n").join(lines))
 
 
 class DevServerTUI(App):
@@ -317,7 +332,7 @@ class DevServerTUI(App):
 
         await self.manager._notify_log(
             "MCP Server",
-            datetime.now().strftime("%H:%M:%S"),
+            get_log_timestamp(),
             f"MCP Server started at {self.mcp_url}",
         )
 
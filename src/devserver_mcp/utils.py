@@ -1,61 +1,82 @@
 import asyncio
 import contextlib
+import importlib
 import logging
 import os
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 
+_devnull = open(os.devnull, "w")  # noqa: SIM115
+
+
+def _redirect_std_fds() -> list[tuple[int, int]]:
+    for stream in (sys.stdout, sys.stderr):
+        with contextlib.suppress(Exception):
+            stream.flush()
+
+    saved_fds = []
+    for fd in (1, 2):
+        try:
+            saved_fds.append((fd, os.dup(fd)))
+            os.dup2(_devnull.fileno(), fd)
+        except OSError:
+            pass
+    return saved_fds
+
+
+def _restore_std_fds(saved_fds: list[tuple[int, int]]) -> None:
+    for fd, saved_fd in saved_fds:
+        with contextlib.suppress(OSError):
+            os.dup2(saved_fd, fd)
+        os.close(saved_fd)
+
 
 @contextlib.contextmanager
 def silence_all_output():
-    with open(os.devnull, "w") as devnull:
-        old_stdout = sys.stdout
-        old_stderr = sys.stderr
-        try:
-            sys.stdout = devnull
-            sys.stderr = devnull
-            yield
-        finally:
-            sys.stdout = old_stdout
-            sys.stderr = old_stderr
+    old_stdout = sys.stdout
+    old_stderr = sys.stderr
+    saved_fds = _redirect_std_fds()
+    try:
+        sys.stdout = _devnull
+        sys.stderr = _devnull
+        yield
+    finally:
+        sys.stdout = old_stdout
+        sys.stderr = old_stderr
+        _restore_std_fds(saved_fds)
 
 
 def configure_silent_logging():
-    logging.getLogger().setLevel(logging.CRITICAL + 1)
-
-    for logger_name in [
-        "uvicorn",
-        "uvicorn.access",
-        "uvicorn.error",
-        "fastapi",
-        "starlette",
-        "fastmcp",
-        "httpx",
-        "asyncio",
-    ]:
-        logger = logging.getLogger(logger_name)
-        logger.setLevel(logging.CRITICAL + 1)
-        logger.disabled = True
-        logger.propagate = False
-
-        for handler in logger.handlers[:]:  # pragma: no cover
-            logger.removeHandler(handler)
+    logging.disable(logging.CRITICAL)
 
 
 def no_op_exception_handler(loop, context):
     pass  # pragma: no cover
 
 
-def _cleanup_loop(loop):
-    with silence_all_output():
-        pending = asyncio.all_tasks(loop)
-        for task in pending:
-            task.cancel()
+async def _cancel_pending_tasks():
+    current = asyncio.current_task()
+    pending = [task for task in asyncio.all_tasks() if task is not current and not task.done()]
+    for task in pending:
+        task.cancel()
 
-        if pending:
-            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
 
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    try:
+        uvloop = importlib.import_module("uvloop")
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
+def _cleanup_loop(loop):
+    with silence_all_output():
+        loop.run_until_complete(_cancel_pending_tasks())
         loop.close()
 
 
@@ -94,3 +115,14 @@ def log_error_to_file(error: Exception, context: str = ""):
 
 def get_tool_emoji() -> str:
     return "🔧"
+
+
+_timestamp_cache: list = [0, ""]
+
+
+def get_log_timestamp() -> str:
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache[0] = now
+        _timestamp_cache[1] = time.strftime("%H:%M:%S", time.localtime(now))
+    return _timestamp_cache[1]
@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from unittest.mock import patch
 
 from click.testing import CliRunner
@@ -34,3 +36,34 @@ def test_cli_help():
     assert result.exit_code == 0
     assert "--config" in result.output
     assert "--port" in result.output
+
+
+def test_cli_import_does_not_load_server_dependencies():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, devserver_mcp; print(sorted({'fastmcp', 'textual', 'yaml'} & set(sys.modules)))",
+        ],
+        capture_output=True,
+        text=True,
+        timeout=10,
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_config_path_resolution_does_not_load_parsers():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from devserver_mcp.config import resolve_config_path; "
+            "print(sorted({'pydantic', 'yaml'} & set(sys.modules)))",
+        ],
+        capture_output=True,
+        text=True,
+        timeout=10,
+    )
+
+    assert result.stdout.strip() == "[]"
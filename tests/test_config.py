@@ -195,3 +195,79 @@ def test_load_config_with_experimental_section_playwright_false():
             assert config.experimental.playwright is False
         finally:
             os.unlink(f.name)
+
+
+def test_load_config_rejects_python_object_tags():
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
+        f.write("servers: !!python/object/apply:os.getcwd []\n")
+        f.flush()
+
+        try:
+            with pytest.raises(yaml.YAMLError):
+                load_config(f.name)
+        finally:
+            os.unlink(f.name)
+
+
+def test_load_config_picks_up_file_changes():
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
+        yaml.dump({"servers": {"backend": {"command": "first", "port": 8000}}}, f)
+
+    try:
+        assert load_config(f.name).servers["backend"].command == "first"
+        assert load_config(f.name).servers["backend"].command == "first"
+
+        with open(f.name, "w") as rewritten:
+            yaml.dump({"servers": {"backend": {"command": "second", "port": 8000}}}, rewritten)
+        stat = os.stat(f.name)
+        os.utime(f.name, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert load_config(f.name).servers["backend"].command == "second"
+    finally:
+        os.unlink(f.name)
+
+
+def test_load_config_picks_up_resized_file_with_same_mtime():
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
+        yaml.dump({"servers": {"backend": {"command": "first", "port": 8000}}}, f)
+
+    try:
+        stat = os.stat(f.name)
+        assert load_config(f.name).servers["backend"].command == "first"
+
+        with open(f.name, "w") as rewritten:
+            yaml.dump({"servers": {"backend": {"command": "second --reload", "port": 8000}}}, rewritten)
+        os.utime(f.name, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert load_config(f.name).servers["backend"].command == "second --reload"
+    finally:
+        os.unlink(f.name)
+
+
+def test_load_config_returns_independent_copies():
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
+        yaml.dump({"servers": {"backend": {"command": "first", "port": 8000}}}, f)
+
+    try:
+        first = load_config(f.name)
+        first.servers["backend"].port = 9999
+
+        second = load_config(f.name)
+
+        assert second is not first
+        assert second.servers["backend"].port == 8000
+    finally:
+        os.unlink(f.name)
+
+
+def test_resolve_config_path_stops_at_git_root(temp_state_dir):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        (root / "test.yml").touch()
+        repo = root / "repo"
+        nested = repo / "src"
+        nested.mkdir(parents=True)
+        (repo / ".git").mkdir()
+
+        with patch("devserver_mcp.config.Path.cwd", return_value=nested):
+            assert resolve_config_path("test.yml") == "test.yml"
@@ -1,6 +1,8 @@
 import asyncio
+import socket
 import sys
 import tempfile
+import time
 from pathlib import Path
 from unittest.mock import patch
 
@@ -48,27 +50,49 @@ def test_init_with_config_path(temp_state_dir):
 def test_is_interactive_terminal_detection():
     server = DevServerMCP(config=Config(servers={}), _skip_port_check=True)
 
-    with (
-        patch.object(sys.stdout, "isatty", return_value=False),
-        patch.object(sys.stderr, "isatty", return_value=True),
-    ):
+    with patch("devserver_mcp.os.isatty", side_effect=lambda fd: fd == 2):
         assert server._is_interactive_terminal() is False
 
     with (
-        patch.object(sys.stdout, "isatty", return_value=True),
-        patch.object(sys.stderr, "isatty", return_value=True),
+        patch("devserver_mcp.os.isatty", return_value=True),
         patch.dict("os.environ", {}, clear=True),
     ):
         assert server._is_interactive_terminal() is True
 
     with (
-        patch.object(sys.stdout, "isatty", return_value=True),
-        patch.object(sys.stderr, "isatty", return_value=True),
+        patch("devserver_mcp.os.isatty", return_value=True),
         patch.dict("os.environ", {"CI": "true"}),
     ):
         assert server._is_interactive_terminal() is False
 
 
+@pytest.mark.skipif(sys.platform != "linux", reason="SO_REUSEADDR is only set on Linux")
+def test_port_check_accepts_port_in_time_wait(simple_config, temp_state_dir):
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as listener:
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        listener.bind(("localhost", 0))
+        listener.listen(1)
+        port = listener.getsockname()[1]
+        client = socket.create_connection(("localhost", port))
+        connection, _ = listener.accept()
+        connection.close()
+        client.close()
+
+    server = DevServerMCP(config=simple_config, port=port)
+
+    assert server.port == port
+
+
+def test_port_check_rejects_port_with_listener(simple_config, temp_state_dir):
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as listener:
+        listener.bind(("localhost", 0))
+        listener.listen(1)
+        port = listener.getsockname()[1]
+
+        with pytest.raises(SystemExit):
+            DevServerMCP(config=simple_config, port=port)
+
+
 @pytest.mark.asyncio
 async def test_cleanup_stops_running_servers(running_config, temp_state_dir):
     server = DevServerMCP(config=running_config, port=8082, _skip_port_check=True)
@@ -81,6 +105,35 @@ async def test_cleanup_stops_running_servers(running_config, temp_state_dir):
     assert server.manager.get_server_status("api")["status"] == "stopped"
 
 
+@pytest.mark.asyncio
+async def test_cleanup_cancels_mcp_task(simple_config, temp_state_dir):
+    server = DevServerMCP(config=simple_config, port=8082, _skip_port_check=True)
+    server._mcp_task = asyncio.create_task(asyncio.Event().wait(), name="devserver-mcp")
+
+    await server._cleanup()
+
+    assert server._mcp_task.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_cleanup_does_not_wait_for_mcp_task_that_delays_cancellation(simple_config, temp_state_dir):
+    async def slow_to_cancel():
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            await asyncio.sleep(10)
+
+    server = DevServerMCP(config=simple_config, port=8082, _skip_port_check=True)
+    server._mcp_task = asyncio.create_task(slow_to_cancel(), name="devserver-mcp")
+    await asyncio.sleep(0)
+
+    started = time.monotonic()
+    await server._cleanup()
+
+    assert time.monotonic() - started < 2
+    assert server._mcp_task.done()
+
+
 def test_config_validation_invalid_yaml(temp_state_dir):
     with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
         f.write("invalid: yaml: content: [")
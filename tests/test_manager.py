@@ -1,9 +1,14 @@
 import asyncio
+import socket
+import sys
+import time
+import urllib.request
+from unittest.mock import patch
 
 import pytest
 
-from devserver_mcp.manager import DevServerManager
-from devserver_mcp.types import OperationStatus, ServerStatusEnum
+from devserver_mcp.manager import PORT_STATUS_TTL, DevServerManager
+from devserver_mcp.types import Config, OperationStatus, ServerConfig, ServerStatusEnum
 
 
 @pytest.fixture
@@ -92,6 +97,17 @@ def test_get_devserver_logs_not_found(manager):
     assert "not found" in result.message
 
 
+@pytest.mark.asyncio
+async def test_server_not_found_results_are_not_shared(manager):
+    first = await manager.start_server("missing")
+    first.message = "changed"
+
+    second = await manager.start_server("missing")
+
+    assert second is not first
+    assert second.message == "Server 'missing' not found"
+
+
 def test_get_devserver_logs_not_running(manager):
     result = manager.get_devserver_logs("api")
 
@@ -154,3 +170,99 @@ async def test_autostart_configured_servers(autostart_config, temp_state_dir):
     assert manager.get_server_status("manual")["status"] == "stopped"
 
     await manager.shutdown_all()
+
+
+@pytest.mark.asyncio
+async def test_notify_log_batch_reaches_batch_and_line_callbacks(manager):
+    batches = []
+    lines = []
+
+    async def capture_batch(server, timestamp, messages):
+        batches.append(messages)
+
+    manager.add_log_batch_callback(capture_batch)
+    manager.add_log_callback(lambda server, timestamp, message: lines.append(message))
+
+    await manager._notify_log_batch("api", "12:00:00", ["first", "second"])
+
+    assert batches == [["first", "second"]]
+    assert lines == ["first", "second"]
+
+
+def test_get_server_status_notices_released_port(temp_state_dir):
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("localhost", 0))
+        s.listen(1)
+        port = s.getsockname()[1]
+        manager = DevServerManager(
+            Config(servers={"api": ServerConfig(command="echo test", port=port)}), "/test/project"
+        )
+
+        assert manager.get_server_status("api")["status"] == "external"
+
+    with patch("devserver_mcp.manager.time.monotonic", return_value=time.monotonic() + PORT_STATUS_TTL):
+        assert manager.get_server_status("api")["status"] == "stopped"
+
+
+@pytest.mark.asyncio
+async def test_wait_for_port_release_returns_once_port_is_free(temp_state_dir):
+    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    s.bind(("127.0.0.1", 0))
+    s.listen(1)
+    port = s.getsockname()[1]
+    manager = DevServerManager(Config(servers={"api": ServerConfig(command="echo test", port=port)}), "/test/project")
+    asyncio.get_running_loop().call_later(0.05, s.close)
+
+    await manager._wait_for_port_release(port)
+
+    assert manager._is_port_in_use(port) is False
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="SO_REUSEADDR is only set on Linux")
+@pytest.mark.asyncio
+async def test_stop_server_frees_port_after_serving_connections(temp_state_dir):
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    command = f"{sys.executable} -m http.server {port} --bind 127.0.0.1"
+    manager = DevServerManager(Config(servers={"web": ServerConfig(command=command, port=port)}), "/test/project")
+
+    assert (await manager.start_server("web")).status == OperationStatus.STARTED
+    try:
+        for _ in range(100):
+            try:
+                urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=1).close()
+                break
+            except OSError:
+                await asyncio.sleep(0.05)
+        for _ in range(3):
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=1) as response:
+                response.read()
+
+        assert (await manager.stop_server("web")).status == OperationStatus.STOPPED
+
+        assert manager.get_server_status("web")["status"] == "stopped"
+        assert (await manager.start_server("web")).status == OperationStatus.STARTED
+    finally:
+        await manager.shutdown_all()
+
+
+def test_get_server_status_is_case_insensitive(manager):
+    assert manager.get_server_status("API")["status"] == "stopped"
+    assert manager.get_server_status("api")["status"] == "stopped"
+
+
+def test_status_callback_registered_during_notification_waits_for_next_change(manager):
+    calls = []
+
+    def late_callback():
+        calls.append("late")
+
+    def registering_callback():
+        calls.append("first")
+        manager.add_status_callback(late_callback)
+
+    manager.add_status_callback(registering_callback)
+    manager._notify_status_change()
+
+    assert calls == ["first"]
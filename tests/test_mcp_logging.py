@@ -62,3 +62,23 @@ async def test_mcp_logging_isolation_from_terminal(manager):
 
     assert stdout_content == "", f"MCP operations leaked to stdout: {repr(stdout_content)}"
     assert stderr_content == "", f"MCP operations leaked to stderr: {repr(stderr_content)}"
+
+
+@pytest.mark.asyncio
+async def test_mcp_logging_includes_tool_arguments(manager):
+    logged_messages = []
+
+    async def capture_log(server_name, timestamp, message):
+        logged_messages.append(message)
+
+    manager.add_log_callback(capture_log)
+
+    mcp_server = create_mcp_server(manager)
+
+    async with Client(mcp_server) as client:
+        await client.call_tool("get_devserver_logs", {"name": "test-server", "limit": 5})
+
+    expected = (
+        "Tool 'get_devserver_logs' called with: {'name': 'test-server', 'offset': 0, 'limit': 5, 'reverse': True}"
+    )
+    assert expected in logged_messages
@@ -1,5 +1,7 @@
 import asyncio
 import os
+import time
+from unittest.mock import patch
 
 import pytest
 
@@ -24,6 +26,37 @@ async def test_process_start_stop_cycle(running_server_config, temp_state_manage
     await process.stop()
 
 
+@pytest.mark.asyncio
+async def test_process_stop_finishes_output_reader(running_server_config, temp_state_manager):
+    process = ManagedProcess("test_server", running_server_config, "blue", temp_state_manager)
+
+    await process.start(lambda server_name, timestamp, messages: None)
+    reader_task = process._reader_task
+    assert reader_task is not None
+
+    await process.stop()
+
+    assert reader_task.done()
+    assert process._reader_task is None
+
+
+@pytest.mark.asyncio
+async def test_process_stop_keeps_output_written_during_shutdown(temp_state_manager):
+    command = "trap 'echo shutting down; exit 0' TERM; while true; do sleep 0.05; done"
+    config = ServerConfig(command=command, working_dir=".", port=12346)
+    process = ManagedProcess("test_server", config, "blue", temp_state_manager)
+    received = []
+
+    async def slow_callback(server_name, timestamp, messages):
+        await asyncio.sleep(0.05)
+        received.extend(messages)
+
+    await process.start(slow_callback)
+    await process.stop()
+
+    assert "shutting down" in received
+
+
 @pytest.mark.asyncio
 async def test_process_handles_command_not_found(temp_state_manager):
     config = ServerConfig(command="nonexistent_command_xyz", working_dir=".", port=12346)
@@ -36,6 +69,39 @@ async def test_process_handles_command_not_found(temp_state_manager):
     assert process.error is not None
 
 
+@pytest.mark.asyncio
+async def test_process_start_returns_as_soon_as_process_exits(temp_state_manager):
+    config = ServerConfig(command="exit 3", working_dir=".", port=12346)
+    process = ManagedProcess("test", config, "blue", temp_state_manager)
+
+    started_at = time.monotonic()
+    with patch("devserver_mcp.process.STARTUP_GRACE_PERIOD", 30):
+        result = await process.start(lambda server_name, timestamp, messages: None)
+
+    assert result is False
+    assert process.error == "Process exited immediately with code 3"
+    assert time.monotonic() - started_at < 5
+
+
+def test_process_work_dir_is_expanded_absolute_path(temp_state_manager):
+    config = ServerConfig(command="true", working_dir="~/project", port=12346)
+    process = ManagedProcess("test", config, "blue", temp_state_manager)
+
+    assert process.work_dir == os.path.join(os.path.expanduser("~"), "project")
+    assert config.working_dir == "~/project"
+
+
+@pytest.mark.asyncio
+async def test_process_is_running_uses_child_exit_status(running_server_config, temp_state_manager):
+    process = ManagedProcess("test_server", running_server_config, "blue", temp_state_manager)
+    await process.start(lambda server_name, timestamp, messages: None)
+
+    with patch("devserver_mcp.process.os.kill", side_effect=AssertionError("probed with a signal")):
+        assert process.is_running
+
+    await process.stop()
+
+
 @pytest.mark.asyncio
 async def test_process_state_persistence(running_server_config, temp_state_manager):
     process1 = ManagedProcess("test_server", running_server_config, "blue", temp_state_manager)
@@ -67,8 +133,8 @@ async def test_process_output_capture(echo_server_config, temp_state_manager):
 
     captured_logs = []
 
-    def log_callback(server_name, timestamp, msg):
-        captured_logs.append(msg)
+    def log_callback(server_name, timestamp, messages):
+        captured_logs.extend(messages)
 
     await process.start(log_callback)
 
@@ -96,3 +162,20 @@ def test_process_reclaim_keeps_live_pid(simple_server_config, temp_state_manager
 
     assert process.pid == current_pid
     assert process.start_time is not None
+
+
+@pytest.mark.asyncio
+async def test_process_output_capture_splits_lines(temp_state_manager):
+    config = ServerConfig(command="printf 'one\\n\\ntwo\\r\\ncaf\\303\\251\\nthree'", working_dir=".", port=12347)
+    process = ManagedProcess("printf_test", config, "blue", temp_state_manager)
+
+    captured_logs = []
+
+    def log_callback(server_name, timestamp, messages):
+        captured_logs.extend(messages)
+
+    await process.start(log_callback)
+    await asyncio.sleep(0.1)
+    await process.stop()
+
+    assert captured_logs == ["one", "two", "café", "three"]
@@ -36,3 +36,5 @@ async def test_server_box_status_updates_after_click_start(running_config, temp_
 
         updated_status = box.query_one("#server-status", Label).renderable
         assert "[#00ff80]● Running[/#00ff80]" in str(updated_status)
+
+    await manager.shutdown_all()
@@ -47,6 +47,28 @@ def test_clear_pid_handles_missing_service():
         manager.clear_pid("nonexistent")
 
 
+def test_clear_pid_skips_write_for_missing_service():
+    with patch.object(Path, "home", return_value=Path(tempfile.mkdtemp())):
+        manager = StateManager("/path/to/project")
+        manager.save_pid("myservice", 12345)
+
+        with patch.object(manager, "_write_state") as write_state:
+            manager.clear_pid("nonexistent")
+
+        write_state.assert_not_called()
+        assert manager.get_pid("myservice") == 12345
+
+
+def test_write_state_leaves_no_temporary_files():
+    with patch.object(Path, "home", return_value=Path(tempfile.mkdtemp())):
+        manager = StateManager("/path/to/project")
+
+        manager.save_pid("myservice", 12345)
+        manager.clear_pid("myservice")
+
+        assert [path.name for path in manager.state_dir.iterdir()] == [manager.state_file.name]
+
+
 def test_cleanup_dead_removes_dead_processes():
     with patch.object(Path, "home", return_value=Path(tempfile.mkdtemp())):
         manager = StateManager("/path/to/project")
@@ -1,10 +1,11 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
+from textual.widgets import RichLog
 
 from devserver_mcp.manager import DevServerManager
 from devserver_mcp.types import Config, ServerConfig, ServerStatus, ServerStatusEnum
-from devserver_mcp.ui import DevServerTUI, LogsWidget, ServerBox, ToolBox
+from devserver_mcp.ui import LOG_FLUSH_INTERVAL, DevServerTUI, LogsWidget, ServerBox, ToolBox
 
 
 @pytest.fixture
@@ -67,6 +68,25 @@ async def test_logs_widget_formatting():
     assert widget is not None
 
 
+async def test_logs_widget_coalesces_burst_into_one_write(manager):
+    app = DevServerTUI(manager, "http://localhost:3001/mcp/")
+    async with app.run_test() as pilot:
+        widget = app.query_one(LogsWidget)
+        await pilot.pause(LOG_FLUSH_INTERVAL * 2)
+        rich_log = widget.query_one(RichLog)
+        rich_log.write = MagicMock()
+
+        await widget.add_log_lines("", "", ["first"])
+        await widget.add_log_lines("", "", ["second"])
+        await widget.add_log_lines("", "", ["third"])
+
+        assert [str(call.args[0]) for call in rich_log.write.call_args_list] == ["first"]
+
+        await pilot.pause(LOG_FLUSH_INTERVAL * 2)
+
+        assert [str(call.args[0]) for call in rich_log.write.call_args_list] == ["first", "second\nthird"]
+
+
 async def test_dev_server_tui_initialization(manager):
     mcp_url = "http://localhost:3001/mcp/"
     app = DevServerTUI(manager, mcp_url)
@@ -1,16 +1,88 @@
+import asyncio
+import logging
 import os
 import sys
 import tempfile
+import time
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
 
-from devserver_mcp.utils import get_tool_emoji, log_error_to_file
+from devserver_mcp.utils import (
+    configure_silent_logging,
+    get_log_timestamp,
+    get_tool_emoji,
+    log_error_to_file,
+    new_event_loop,
+    silence_all_output,
+)
 
 
 def test_get_tool_emoji():
     assert get_tool_emoji() == "🔧"
 
 
+def test_get_log_timestamp_follows_wall_clock():
+    with patch("devserver_mcp.utils.time.time", return_value=3600.0):
+        first = get_log_timestamp()
+    with patch("devserver_mcp.utils.time.time", return_value=3661.0):
+        second = get_log_timestamp()
+
+    assert first == time.strftime("%H:%M:%S", time.localtime(3600))
+    assert second == time.strftime("%H:%M:%S", time.localtime(3661))
+
+
+def test_configure_silent_logging_disables_every_logger():
+    try:
+        configure_silent_logging()
+
+        assert not logging.getLogger("uvicorn.error").isEnabledFor(logging.CRITICAL)
+        assert not logging.getLogger("some.third.party").isEnabledFor(logging.ERROR)
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+def test_silence_all_output_restores_streams():
+    original_stdout, original_stderr = sys.stdout, sys.stderr
+
+    with silence_all_output():
+        print("hidden")
+        assert sys.stdout is not original_stdout
+        assert sys.stderr is not original_stderr
+
+    assert sys.stdout is original_stdout
+    assert sys.stderr is original_stderr
+
+
+def test_silence_all_output_silences_file_descriptors(capfd):
+    with silence_all_output():
+        os.write(1, b"hidden stdout\n")
+        os.write(2, b"hidden stderr\n")
+    os.write(1, b"visible\n")
+
+    captured = capfd.readouterr()
+    assert captured.out == "visible\n"
+    assert captured.err == ""
+
+
+def test_new_event_loop_falls_back_to_asyncio():
+    with patch.dict(sys.modules, {"uvloop": None}):
+        loop = new_event_loop()
+
+    try:
+        assert isinstance(loop, asyncio.AbstractEventLoop)
+    finally:
+        loop.close()
+
+
+def test_new_event_loop_prefers_uvloop():
+    sentinel = object()
+    fake_uvloop = SimpleNamespace(new_event_loop=lambda: sentinel)
+
+    with patch.dict(sys.modules, {"uvloop": fake_uvloop}):
+        assert new_event_loop() is sentinel
+
+
 def test_log_error_to_file():
     with tempfile.TemporaryDirectory() as temp_dir:
         original_cwd = Path.cwd()